@@ -6,30 +6,116 @@ Build script for UptimeWatcher using PyInstaller
 import os
 import sys
 import subprocess
-import shutil
-import platform
+import hashlib
+import tarfile
 from pathlib import Path
 
+QT_CACHE_DIR = Path.home() / ".cache" / "UptimeWatcher"
+PIP_CACHE_DIR = Path.home() / ".cache" / "uw-pip"
+PYINSTALLER_VERSION = "6.10.0"
+
 def install_pyinstaller():
-    """Install PyInstaller if not already installed"""
+    """Install the pinned PyInstaller version if not already installed"""
+    try:
+        from importlib.metadata import version
+        if version("PyInstaller") == PYINSTALLER_VERSION:
+            print("✅ PyInstaller is already installed")
+            return
+    except Exception:
+        pass
+    print("📦 Installing PyInstaller...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install",
+                           "--cache-dir", str(PIP_CACHE_DIR),
+                           "--prefer-binary",
+                           "-r", "requirements-build.txt"])
+    print("✅ PyInstaller installed successfully")
+
+def full_rebuild_requested():
+    """Check if a full clean rebuild was requested via UW_FULL_REBUILD=1"""
+    return os.environ.get('UW_FULL_REBUILD') == '1'
+
+def fast_rmtree(path):
+    """Remove a directory tree with unlinks spread across worker threads
+
+    PyInstaller trees hold tens of thousands of small files, so removal is
+    bound by per-file unlink() latency; threads overlap those syscalls.
+    Directories are removed bottom-up once their children are gone.
+    """
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor
     try:
-        import PyInstaller
-        print("✅ PyInstaller is already installed")
-    except ImportError:
-        print("📦 Installing PyInstaller...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
-        print("✅ PyInstaller installed successfully")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for root, dirs, files in os.walk(path, topdown=False):
+                list(pool.map(os.unlink, (os.path.join(root, f) for f in files)))
+                for d in dirs:
+                    os.rmdir(os.path.join(root, d))
+        os.rmdir(path)
+    except OSError:
+        shutil.rmtree(path)
 
 def clean_build_dirs():
     """Clean previous build directories"""
     build_dirs = ['build', 'dist', '__pycache__']
     for dir_name in build_dirs:
         if os.path.exists(dir_name):
-            shutil.rmtree(dir_name)
+            fast_rmtree(dir_name)
             print(f"🧹 Cleaned {dir_name}/")
 
+def qt_payload_key():
+    """Compute a cache key for the packed Qt payload (PySide6 hash + Python version)"""
+    try:
+        from importlib.metadata import distribution
+        record = distribution('PySide6').read_text('RECORD') or ''
+        digest = hashlib.sha256(record.encode())
+        digest.update(sys.version.encode())
+        return digest.hexdigest()[:16]
+    except Exception:
+        return None
+
+def qt_payload_archive():
+    """Locate the cached Qt payload archive for the current environment"""
+    key = qt_payload_key()
+    if key is None:
+        return None
+    return QT_CACHE_DIR / f"qt-{key}.tar.gz"
+
+def restore_qt_payload(archive):
+    """Restore the cached PyInstaller work directory for the current Qt payload"""
+    if archive is not None and archive.exists() and not os.path.exists('build'):
+        print("♻️ Restoring cached Qt payload...")
+        with tarfile.open(archive, 'r:gz') as tar:
+            tar.extractall('.')
+
+def save_qt_payload(archive):
+    """Cache the PyInstaller work directory so the Qt payload is packed only once"""
+    if archive is None or archive.exists() or not os.path.exists('build'):
+        return
+    print("💾 Caching Qt payload for future builds...")
+    QT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_archive = archive.with_suffix('.tmp')
+    with tarfile.open(tmp_archive, 'w:gz') as tar:
+        tar.add('build')
+    tmp_archive.replace(archive)
+
+def compiler_cache_env():
+    """Wrap the C toolchain with ccache/sccache so bootloader compiles hit a cache"""
+    import shutil
+    import platform
+    env = os.environ.copy()
+    if platform.system() == 'Windows':
+        if shutil.which('sccache'):
+            env['CC'] = 'sccache cl'
+            env['SCCACHE_DIR'] = str(Path.home() / ".cache" / "uw-sccache")
+    elif shutil.which('ccache'):
+        env['CC'] = 'ccache cc'
+        env['CXX'] = 'ccache c++'
+        env['CCACHE_COMPILERCHECK'] = 'content'
+        env['CCACHE_DIR'] = str(Path.home() / ".cache" / "uw-ccache")
+    return env
+
 def build_for_platform():
     """Build executable for current platform"""
+    import platform
     current_platform = platform.system().lower()
     
     if current_platform == 'linux':
@@ -50,9 +136,18 @@ def build_for_platform():
         return False
     
     try:
-        # Run PyInstaller
-        cmd = [sys.executable, "-m", "PyInstaller", "--clean", spec_file]
-        subprocess.check_call(cmd)
+        # Reuse the packed Qt payload from previous builds when PySide6 is
+        # unchanged; a full rebuild must not seed itself from the cache
+        archive = qt_payload_archive()
+        if not full_rebuild_requested():
+            restore_qt_payload(archive)
+
+        # Run PyInstaller (reuse cached analysis unless a full rebuild was requested)
+        cmd = [sys.executable, "-m", "PyInstaller", "--noconfirm", spec_file]
+        if full_rebuild_requested():
+            cmd.insert(3, "--clean")
+        subprocess.check_call(cmd, env=compiler_cache_env())
+        save_qt_payload(archive)
         print("✅ Build completed successfully!")
         return True
     except subprocess.CalledProcessError as e:
@@ -105,7 +200,14 @@ VarFileInfo([VarStruct('Translation', [1033, 1200])])
   ]
 )'''
     
-    with open('version_info.txt', 'w') as f:
+    # Skip the write when the content is already current so the file's
+    # mtime stays stable and downstream build caches aren't invalidated
+    version_file = Path('version_info.txt')
+    if version_file.exists() and version_file.read_text() == version_info:
+        print("✅ Version info file up to date")
+        return
+
+    with open(version_file, 'w') as f:
         f.write(version_info)
     print("✅ Version info file created")
 
@@ -119,9 +221,11 @@ def main():
     
     # Install PyInstaller
     install_pyinstaller()
-    
-    # Clean previous builds
-    clean_build_dirs()
+
+    # Clean previous builds only on explicit full rebuild (UW_FULL_REBUILD=1),
+    # so PyInstaller can reuse its cached analysis between runs
+    if full_rebuild_requested():
+        clean_build_dirs()
     
     # Build for current platform
     success = build_for_platform()
@@ -131,15 +235,16 @@ def main():
         print("✅ Build completed successfully!")
         print(f"📁 Executable can be found in: {os.path.abspath('dist')}")
         
-        # List built files
-        dist_dir = Path('dist')
-        if dist_dir.exists():
+        # List built files (scandir reuses the directory entry type info,
+        # avoiding a stat() per file)
+        if os.path.exists('dist'):
             print("\n📦 Built files:")
-            for item in dist_dir.iterdir():
-                if item.is_file():
-                    print(f"  📄 {item.name}")
-                elif item.is_dir():
-                    print(f"  📁 {item.name}/")
+            with os.scandir('dist') as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        print(f"  📁 {entry.name}/")
+                    else:
+                        print(f"  📄 {entry.name}")
     else:
         print("❌ Build failed!")
         sys.exit(1)
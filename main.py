@@ -9,130 +9,129 @@ import os
 import time
 import json
 import logging
-from datetime import datetime, timedelta
+import functools
+import threading
+import subprocess
 from pathlib import Path
-from PySide6.QtWidgets import (QApplication, QSystemTrayIcon, QMenu, 
-                               QMessageBox, QDialog, QVBoxLayout, QHBoxLayout,
-                               QLabel, QPushButton, QSpinBox, QComboBox, QFrame,
+from PySide6.QtWidgets import (QApplication, QSystemTrayIcon, QMenu,
+                               QMessageBox, QDialog, QVBoxLayout,
+                               QLabel, QPushButton, QFrame,
                                QScrollArea, QWidget)
-from PySide6.QtCore import QTimer, QThread, Signal, Qt, QPropertyAnimation, QEasingCurve
-from PySide6.QtGui import QIcon, QPixmap, QPainter, QAction, QFont, QPalette
+from PySide6.QtCore import QTimer, Signal, Qt
+from PySide6.QtGui import QIcon, QPixmap, QPainter, QAction
 import psutil
 import darkdetect
 
-class UptimeChecker(QThread):
-    """Thread to check system uptime every 5 minutes"""
-    uptime_signal = Signal(int)  # Signal to emit uptime in seconds
-    
-    def __init__(self):
-        super().__init__()
-        self.running = True
-        
-    def run(self):
-        while self.running:
-            try:
-                # Get system uptime using psutil
-                uptime_seconds = int(time.time() - psutil.boot_time())
-                self.uptime_signal.emit(uptime_seconds)
-                
-                # Wait 5 minutes (300 seconds)
-                for _ in range(300):
-                    if not self.running:
-                        break
-                    time.sleep(1)
-                    
-            except Exception as e:
-                logging.error(f"Error checking uptime: {e}")
-                time.sleep(60)  # Wait 1 minute on error
-                
-    def stop(self):
-        self.running = False
+try:
+    import orjson  # C JSON codec; optional, stdlib json is the fallback
+except ImportError:
+    orjson = None
 
-class ModernDelayDialog(QDialog):
-    """Modern iOS-style dialog for delay selection with scroll area"""
-    
-    def __init__(self, parent=None, total_delay_hours=0):
-        super().__init__(parent)
-        self.setWindowTitle("")
-        self.setModal(True)
-        self.setFixedSize(450, 500)  # Increased height from 300 to 500
-        self.setWindowFlags(Qt.Dialog | Qt.CustomizeWindowHint)
-        
-        self.total_delay_hours = total_delay_hours
-        self.selected_delay = 0
-        
-        # Main layout
-        main_layout = QVBoxLayout()
-        main_layout.setSpacing(0)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Container frame
-        container = QFrame()
-        is_dark = darkdetect.isDark()
-        
-        if is_dark:
-            container_bg = "rgba(40, 40, 40, 0.95)"
-            container_border = "rgba(255, 255, 255, 0.1)"
-        else:
-            container_bg = "rgba(248, 248, 248, 0.95)"
-            container_border = "rgba(0, 0, 0, 0.1)"
-        
-        container.setStyleSheet(f"""
+# Per-platform data locations; these never change while the process runs
+if os.name == 'nt':
+    CONFIG_DIR = Path(os.getenv('APPDATA')) / "UptimeWatcher"
+    LOG_DIR = CONFIG_DIR
+else:
+    CONFIG_DIR = Path.home() / ".config" / "UptimeWatcher"
+    LOG_DIR = Path("/tmp/SelfCare")
+CONFIG_FILE = CONFIG_DIR / "config.json"
+LOG_FILE = LOG_DIR / "uptimewatcher.log"
+
+# Application-wide dark stylesheet, parsed by Qt once per theme transition
+_DARK_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QLabel {
+        color: #ffffff;
+    }
+    QPushButton {
+        background-color: #3c3c3c;
+        border: 1px solid #555555;
+        color: #ffffff;
+        padding: 5px;
+        border-radius: 3px;
+    }
+    QPushButton:hover {
+        background-color: #4c4c4c;
+    }
+    QSpinBox, QComboBox {
+        background-color: #3c3c3c;
+        border: 1px solid #555555;
+        color: #ffffff;
+        padding: 2px;
+    }
+"""
+
+def _build_dialog_styles(is_dark):
+    """Resolve every dialog stylesheet for one theme into plain strings"""
+    if is_dark:
+        container_bg = "rgba(40, 40, 40, 0.95)"
+        reboot_container_bg = "rgba(40, 40, 40, 0.98)"
+        container_border = "rgba(255, 255, 255, 0.1)"
+        title_color = "#FFFFFF"
+        message_color = "#CCCCCC"
+        scroll_bg = "rgba(255, 255, 255, 0.1)"
+        scroll_handle = "rgba(255, 255, 255, 0.3)"
+        scroll_handle_hover = "rgba(255, 255, 255, 0.5)"
+    else:
+        container_bg = "rgba(248, 248, 248, 0.95)"
+        reboot_container_bg = "rgba(248, 248, 248, 0.98)"
+        container_border = "rgba(0, 0, 0, 0.1)"
+        title_color = "#333"
+        message_color = "#666"
+        scroll_bg = "rgba(0, 0, 0, 0.1)"
+        scroll_handle = "rgba(0, 0, 0, 0.3)"
+        scroll_handle_hover = "rgba(0, 0, 0, 0.5)"
+
+    return {
+        "container": f"""
             QFrame {{
                 background-color: {container_bg};
                 border-radius: 20px;
                 border: 1px solid {container_border};
             }}
-        """)
-        
-        container_layout = QVBoxLayout(container)
-        container_layout.setSpacing(20)
-        container_layout.setContentsMargins(30, 30, 30, 30)
-        
-        # Title
-        title_label = QLabel("Delay Reboot Reminder")
-        title_label.setAlignment(Qt.AlignCenter)
-        title_color = "#FFFFFF" if is_dark else "#333"
-        title_label.setStyleSheet(f"""
+        """,
+        "reboot_container": f"""
+            QFrame {{
+                background-color: {reboot_container_bg};
+                border-radius: 20px;
+                border: 1px solid {container_border};
+            }}
+        """,
+        "title": f"""
             QLabel {{
                 font-size: 18px;
                 font-weight: bold;
                 color: {title_color};
                 margin-bottom: 10px;
             }}
-        """)
-        container_layout.addWidget(title_label)
-        
-        # Subtitle
-        subtitle_label = QLabel("How long would you like to delay?")
-        subtitle_label.setAlignment(Qt.AlignCenter)
-        subtitle_color = "#CCCCCC" if is_dark else "#666"
-        subtitle_label.setStyleSheet(f"""
+        """,
+        "reboot_title": f"""
+            QLabel {{
+                font-size: 20px;
+                font-weight: bold;
+                color: {title_color};
+                margin-bottom: 10px;
+            }}
+        """,
+        "subtitle": f"""
             QLabel {{
                 font-size: 14px;
-                color: {subtitle_color};
+                color: {message_color};
                 margin-bottom: 20px;
             }}
-        """)
-        container_layout.addWidget(subtitle_label)
-        
-        # Create scroll area for buttons
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        
-        # Dark mode scroll bar styling
-        if is_dark:
-            scroll_bg = "rgba(255, 255, 255, 0.1)"
-            scroll_handle = "rgba(255, 255, 255, 0.3)"
-            scroll_handle_hover = "rgba(255, 255, 255, 0.5)"
-        else:
-            scroll_bg = "rgba(0, 0, 0, 0.1)"
-            scroll_handle = "rgba(0, 0, 0, 0.3)"
-            scroll_handle_hover = "rgba(0, 0, 0, 0.5)"
-        
-        scroll_area.setStyleSheet(f"""
+        """,
+        "message": f"""
+            QLabel {{
+                font-size: 14px;
+                color: {message_color};
+                line-height: 1.4;
+                margin-bottom: 20px;
+            }}
+        """,
+        "scroll": f"""
             QScrollArea {{
                 border: none;
                 background-color: transparent;
@@ -158,64 +157,192 @@ class ModernDelayDialog(QDialog):
             QScrollBar::sub-page:vertical {{
                 background: none;
             }}
-        """)
+        """,
+    }
+
+# Theme sampled once at import; updated from the theme-change signal only
+_IS_DARK = darkdetect.isDark()
+_STYLES_DARK = _build_dialog_styles(True)
+_STYLES_LIGHT = _build_dialog_styles(False)
+
+# Theme-independent dialog stylesheets
+_DELAY_BUTTON_QSS = """
+    QPushButton {
+        background-color: #007AFF;
+        color: white;
+        border: none;
+        border-radius: 12px;
+        padding: 15px 20px;
+        font-size: 16px;
+        font-weight: 600;
+        margin: 3px;
+    }
+    QPushButton:hover {
+        background-color: #0056CC;
+    }
+    QPushButton:pressed {
+        background-color: #004299;
+    }
+"""
+
+_WARNING_LABEL_QSS = """
+    QLabel {
+        font-size: 12px;
+        color: #FF3B30;
+        margin-top: 15px;
+        padding: 10px;
+        background-color: rgba(255, 59, 48, 0.1);
+        border-radius: 8px;
+    }
+"""
+
+_ICON_LABEL_QSS = """
+    QLabel {
+        font-size: 48px;
+        margin-bottom: 10px;
+    }
+"""
+
+_REBOOT_BUTTON_QSS = """
+    QPushButton {
+        background-color: #FF3B30;
+        color: white;
+        border: none;
+        border-radius: 12px;
+        padding: 15px 30px;
+        font-size: 16px;
+        font-weight: 600;
+    }
+    QPushButton:hover {
+        background-color: #CC2E24;
+    }
+    QPushButton:pressed {
+        background-color: #A0241A;
+    }
+"""
+
+_SKIP_BUTTON_QSS = """
+    QPushButton {
+        background-color: #007AFF;
+        color: white;
+        border: none;
+        border-radius: 12px;
+        padding: 15px 30px;
+        font-size: 16px;
+        font-weight: 600;
+    }
+    QPushButton:hover {
+        background-color: #0056CC;
+    }
+    QPushButton:pressed {
+        background-color: #004299;
+    }
+"""
+
+# Delay choices are invariant; the 48-hour budget filter runs per dialog,
+# falling back to the last (10-minute) entry when the budget is spent
+_DELAY_OPTIONS = (
+    ("24 hours later", 24 * 3600),
+    ("10 hours later", 10 * 3600),
+    ("5 hours later", 5 * 3600),
+    ("3 hours later", 3 * 3600),
+    ("1 hour later", 1 * 3600),
+    ("10 minutes later", 10 * 60),
+)
+
+_DELAY_DIALOG_QSS = """
+    QDialog {
+        background-color: rgba(0, 0, 0, 0.4);
+    }
+"""
+
+_REBOOT_DIALOG_QSS = """
+    QDialog {
+        background-color: rgba(0, 0, 0, 0.5);
+    }
+"""
+
+@functools.lru_cache(maxsize=4)
+def _render_timer_icon(is_dark, dpr):
+    """Render the tray timer icon once per (theme, device pixel ratio) pair"""
+    size = 32 * dpr
+    pixmap = QPixmap(size, size)
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+
+    # Draw clock face
+    painter.setPen(Qt.white if is_dark else Qt.black)
+    painter.drawEllipse(2, 2, 28, 28)
+
+    # Draw clock hands
+    painter.drawLine(16, 16, 16, 8)   # Hour hand
+    painter.drawLine(16, 16, 22, 16)  # Minute hand
+
+    painter.end()
+    return QIcon(pixmap)
+
+class ModernDelayDialog(QDialog):
+    """Modern iOS-style dialog for delay selection with scroll area"""
+    
+    def __init__(self, parent=None, total_delay_hours=0):
+        super().__init__(parent)
+        self.setWindowTitle("")
+        self.setModal(True)
+        self.setFixedSize(450, 500)  # Increased height from 300 to 500
+        self.setWindowFlags(Qt.Dialog | Qt.CustomizeWindowHint)
         
+        # Main layout
+        main_layout = QVBoxLayout()
+        main_layout.setSpacing(0)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Container frame (stylesheets pre-resolved per theme at import)
+        styles = _STYLES_DARK if _IS_DARK else _STYLES_LIGHT
+        container = QFrame()
+        container.setStyleSheet(styles["container"])
+
+        container_layout = QVBoxLayout(container)
+        container_layout.setSpacing(20)
+        container_layout.setContentsMargins(30, 30, 30, 30)
+
+        # Title
+        title_label = QLabel("Delay Reboot Reminder")
+        title_label.setAlignment(Qt.AlignCenter)
+        title_label.setStyleSheet(styles["title"])
+        container_layout.addWidget(title_label)
+
+        # Subtitle
+        subtitle_label = QLabel("How long would you like to delay?")
+        subtitle_label.setAlignment(Qt.AlignCenter)
+        subtitle_label.setStyleSheet(styles["subtitle"])
+        container_layout.addWidget(subtitle_label)
+
+        # Create scroll area for buttons
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        scroll_area.setStyleSheet(styles["scroll"])
+
         # Create widget to hold buttons
         buttons_widget = QWidget()
         buttons_layout = QVBoxLayout(buttons_widget)
         buttons_layout.setSpacing(8)
         buttons_layout.setContentsMargins(0, 0, 0, 0)
         
-        # Delay options
-        delay_options = []
-        
-        if total_delay_hours < 48:
-            delay_options = [
-                ("24 hours later", 24 * 3600),
-                ("10 hours later", 10 * 3600),
-                ("5 hours later", 5 * 3600),
-                ("3 hours later", 3 * 3600),
-                ("1 hour later", 1 * 3600),
-                ("10 minutes later", 10 * 60)
-            ]
-        else:
-            delay_options = [
-                ("10 minutes later", 10 * 60)
-            ]
-        
-        # Filter options that would exceed 48 hours
-        filtered_options = []
-        for text, seconds in delay_options:
-            if (total_delay_hours * 3600 + seconds) <= 48 * 3600:
-                filtered_options.append((text, seconds))
-        
-        if not filtered_options:
-            filtered_options = [("10 minutes later", 10 * 60)]
-        
-        # Create buttons for each option
-        for text, seconds in filtered_options:
+        # Create one button per option; set_total_delay_hours shows the
+        # ones that fit the remaining 48-hour budget
+        self._option_buttons = []
+        for text, seconds in _DELAY_OPTIONS:
             btn = QPushButton(text)
             btn.setMinimumHeight(50)  # Increased button height
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #007AFF;
-                    color: white;
-                    border: none;
-                    border-radius: 12px;
-                    padding: 15px 20px;
-                    font-size: 16px;
-                    font-weight: 600;
-                    margin: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #0056CC;
-                }
-                QPushButton:pressed {
-                    background-color: #004299;
-                }
-            """)
-            btn.clicked.connect(lambda checked, s=seconds: self.delay_selected(s))
+            btn.setStyleSheet(_DELAY_BUTTON_QSS)
+            btn.clicked.connect(functools.partial(self.delay_selected, seconds))
             buttons_layout.addWidget(btn)
+            self._option_buttons.append((seconds, btn))
         
         # Add stretch to push buttons to top
         buttons_layout.addStretch()
@@ -226,37 +353,48 @@ class ModernDelayDialog(QDialog):
         # Add scroll area to container
         container_layout.addWidget(scroll_area)
         
-        # Warning label for 48 hour limit
-        if total_delay_hours >= 24:
-            warning_label = QLabel(f"⚠️ You've already delayed for {total_delay_hours} hours. Maximum delay is 48 hours.")
-            warning_label.setAlignment(Qt.AlignCenter)
-            warning_label.setWordWrap(True)
-            warning_label.setStyleSheet("""
-                QLabel {
-                    font-size: 12px;
-                    color: #FF3B30;
-                    margin-top: 15px;
-                    padding: 10px;
-                    background-color: rgba(255, 59, 48, 0.1);
-                    border-radius: 8px;
-                }
-            """)
-            container_layout.addWidget(warning_label)
-        
+        # Warning label for 48 hour limit (shown by set_total_delay_hours)
+        self.warning_label = QLabel()
+        self.warning_label.setAlignment(Qt.AlignCenter)
+        self.warning_label.setWordWrap(True)
+        self.warning_label.setStyleSheet(_WARNING_LABEL_QSS)
+        self.warning_label.hide()
+        container_layout.addWidget(self.warning_label)
+
         main_layout.addWidget(container)
         self.setLayout(main_layout)
-        
+
         # Apply modern styling
-        self.setStyleSheet("""
-            QDialog {
-                background-color: rgba(0, 0, 0, 0.4);
-            }
-        """)
-        
+        self.setStyleSheet(_DELAY_DIALOG_QSS)
+
+        self.set_total_delay_hours(total_delay_hours)
+
+    def set_total_delay_hours(self, total_delay_hours):
+        """Show the options that fit the remaining 48-hour budget"""
+        self.total_delay_hours = total_delay_hours
+        self.selected_delay = 0
+
+        budget = 48 * 3600 - total_delay_hours * 3600
+        any_visible = False
+        for seconds, btn in self._option_buttons:
+            visible = total_delay_hours < 48 and seconds <= budget
+            btn.setVisible(visible)
+            any_visible = any_visible or visible
+
+        if not any_visible:
+            # Always offer at least the 10-minute option
+            self._option_buttons[-1][1].setVisible(True)
+
+        if total_delay_hours >= 24:
+            self.warning_label.setText(f"⚠️ You've already delayed for {total_delay_hours} hours. Maximum delay is 48 hours.")
+            self.warning_label.show()
+        else:
+            self.warning_label.hide()
+
     def delay_selected(self, seconds):
         self.selected_delay = seconds
         self.accept()
-        
+
     def get_delay_seconds(self):
         return self.selected_delay
 
@@ -278,131 +416,64 @@ class ModernRebootDialog(QDialog):
         main_layout.setSpacing(0)
         main_layout.setContentsMargins(20, 20, 20, 20)
         
-        # Container frame
+        # Container frame (stylesheets pre-resolved per theme at import)
+        styles = _STYLES_DARK if _IS_DARK else _STYLES_LIGHT
         container = QFrame()
-        is_dark = darkdetect.isDark()
-        
-        if is_dark:
-            container_bg = "rgba(40, 40, 40, 0.98)"
-            container_border = "rgba(255, 255, 255, 0.1)"
-            title_color = "#FFFFFF"
-            message_color = "#CCCCCC"
-        else:
-            container_bg = "rgba(248, 248, 248, 0.98)"
-            container_border = "rgba(0, 0, 0, 0.1)"
-            title_color = "#333"
-            message_color = "#666"
-        
-        container.setStyleSheet(f"""
-            QFrame {{
-                background-color: {container_bg};
-                border-radius: 20px;
-                border: 1px solid {container_border};
-            }}
-        """)
-        
+        container.setStyleSheet(styles["reboot_container"])
+
         container_layout = QVBoxLayout(container)
         container_layout.setSpacing(25)
         container_layout.setContentsMargins(40, 40, 40, 40)
-        
+
         # Warning icon
         icon_label = QLabel("⚠️")
         icon_label.setAlignment(Qt.AlignCenter)
-        icon_label.setStyleSheet("""
-            QLabel {
-                font-size: 48px;
-                margin-bottom: 10px;
-            }
-        """)
+        icon_label.setStyleSheet(_ICON_LABEL_QSS)
         container_layout.addWidget(icon_label)
-        
+
         # Title
         title_label = QLabel("Reboot Recommended")
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 20px;
-                font-weight: bold;
-                color: {title_color};
-                margin-bottom: 10px;
-            }}
-        """)
+        title_label.setStyleSheet(styles["reboot_title"])
         container_layout.addWidget(title_label)
-        
+
         # Message
-        message_label = QLabel(f"Your system has been running for {uptime_str}.\n\nIt's recommended to reboot your system regularly for optimal performance and security.")
-        message_label.setAlignment(Qt.AlignCenter)
-        message_label.setWordWrap(True)
-        message_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 14px;
-                color: {message_color};
-                line-height: 1.4;
-                margin-bottom: 20px;
-            }}
-        """)
-        container_layout.addWidget(message_label)
-        
+        self.message_label = QLabel()
+        self.message_label.setAlignment(Qt.AlignCenter)
+        self.message_label.setWordWrap(True)
+        self.message_label.setStyleSheet(styles["message"])
+        container_layout.addWidget(self.message_label)
+        self.set_uptime_text(uptime_str)
+
         # Buttons
         button_layout = QVBoxLayout()
         button_layout.setSpacing(10)
-        
+
         # Reboot Now button
         reboot_btn = QPushButton("Reboot Now")
-        reboot_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FF3B30;
-                color: white;
-                border: none;
-                border-radius: 12px;
-                padding: 15px 30px;
-                font-size: 16px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #CC2E24;
-            }
-            QPushButton:pressed {
-                background-color: #A0241A;
-            }
-        """)
+        reboot_btn.setStyleSheet(_REBOOT_BUTTON_QSS)
         reboot_btn.clicked.connect(self.reboot_now)
         button_layout.addWidget(reboot_btn)
-        
+
         # Skip Reboot button
         skip_btn = QPushButton("Skip Reboot")
-        skip_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007AFF;
-                color: white;
-                border: none;
-                border-radius: 12px;
-                padding: 15px 30px;
-                font-size: 16px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #0056CC;
-            }
-            QPushButton:pressed {
-                background-color: #004299;
-            }
-        """)
+        skip_btn.setStyleSheet(_SKIP_BUTTON_QSS)
         skip_btn.clicked.connect(self.skip_reboot)
         button_layout.addWidget(skip_btn)
-        
+
         container_layout.addLayout(button_layout)
-        
+
         main_layout.addWidget(container)
         self.setLayout(main_layout)
-        
+
         # Apply modern styling
-        self.setStyleSheet("""
-            QDialog {
-                background-color: rgba(0, 0, 0, 0.5);
-            }
-        """)
-        
+        self.setStyleSheet(_REBOOT_DIALOG_QSS)
+
+    def set_uptime_text(self, uptime_str):
+        """Update the message for a new uptime reading and reset the action"""
+        self.user_action = None
+        self.message_label.setText(f"Your system has been running for {uptime_str}.\n\nIt's recommended to reboot your system regularly for optimal performance and security.")
+
     def reboot_now(self):
         self.user_action = "reboot"
         self.accept()
@@ -424,7 +495,8 @@ class ModernRebootDialog(QDialog):
 
 class UptimeWatcher(QApplication):
     """Main application class"""
-    
+    theme_changed = Signal()  # Emitted from the theme listener thread
+
     def __init__(self):
         super().__init__(sys.argv)
         
@@ -432,41 +504,66 @@ class UptimeWatcher(QApplication):
         self.setup_logging()
         
         # Configuration
-        if os.name == 'nt':
-            self.config_file = Path(os.getenv('APPDATA')) / "UptimeWatcher" / "config.json"
-        else:
-            self.config_file = Path.home() / ".config" / "UptimeWatcher" / "config.json"
+        self.config_file = CONFIG_FILE
         self.config = self.load_config()
-        
+        self._config_dirty = False
+
+        # Boot time is invariant for the process lifetime; read it once
+        self._boot_time = psutil.boot_time()
+
+        # Detect a reboot since the last run and reset the delay state
+        if self.config["last_boot_time"] != 0 and self._boot_time != self.config["last_boot_time"]:
+            self._set_cfg("ignore_today", False)
+            self._set_cfg("ignore_until", 0)
+            self._set_cfg("total_delay_time", 0)
+            self._set_cfg("delay_start_time", 0)
+        self._set_cfg("last_boot_time", self._boot_time)
+
+
         # Check if system tray is available
         if not QSystemTrayIcon.isSystemTrayAvailable():
             QMessageBox.critical(None, "System Tray",
                                "System tray is not available on this system.")
             sys.exit(1)
             
+        # Pre-render both tray icon variants once; theme changes just swap them
+        dpr = int(self.devicePixelRatio())
+        self._icon_dark = _render_timer_icon(True, dpr)
+        self._icon_light = _render_timer_icon(False, dpr)
+
         # Create system tray icon
         self.create_tray_icon()
         
-        # Start uptime checker thread
-        self.uptime_checker = UptimeChecker()
-        self.uptime_checker.uptime_signal.connect(self.handle_uptime)
-        self.uptime_checker.start()
-        
-        # Apply dark mode if detected
+        # Cache of the last formatted uptime, keyed by minute bucket
+        self._last_fmt_bucket = -1
+        self._last_fmt_str = ""
+
+        # Reminder dialogs are built lazily once and then mutated in place
+        self._reboot_dialog = None
+        self._delay_dialog = None
+        self._dialog_styles_stale = False
+
+        # Check uptime every 5 minutes from the Qt event loop
+        self.uptime_timer = QTimer(self)
+        self.uptime_timer.setInterval(5 * 60 * 1000)
+        self.uptime_timer.timeout.connect(self._tick)
+        self.uptime_timer.start()
+        self._tick()  # Initial check at startup
+        
+        # Apply dark mode if detected, then track OS theme changes
+        self._applied_theme = None
         self.apply_theme()
-        
+        self.theme_changed.connect(self.apply_theme)
+        threading.Thread(target=self._watch_theme, daemon=True).start()
+
+
         logging.info("UptimeWatcher started")
         
     def setup_logging(self):
         """Setup logging for the application"""
-        if os.name == 'nt':
-            log_dir = Path(os.getenv('APPDATA')) / "UptimeWatcher"
-        else:
-            log_dir = Path("/tmp/SelfCare")
-        log_dir.mkdir(exist_ok=True)
-        
-        log_file = log_dir / "uptimewatcher.log"
-        
+        LOG_DIR.mkdir(exist_ok=True)
+        log_file = LOG_FILE
+
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s',
@@ -482,6 +579,7 @@ class UptimeWatcher(QApplication):
             "last_reboot_reminder": 0,
             "ignore_until": 0,
             "ignore_today": False,
+            "ignore_until_date": 0,  # YYYYMMDD integer
             "last_boot_time": 0,
             "total_delay_time": 0,
             "delay_start_time": 0
@@ -490,19 +588,31 @@ class UptimeWatcher(QApplication):
         try:
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
             if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    return {**default_config, **config}
+                data = self.config_file.read_bytes()
+                config = orjson.loads(data) if orjson else json.loads(data)
+                return {**default_config, **config}
         except Exception as e:
             logging.error(f"Error loading config: {e}")
             
         return default_config
         
+    def _set_cfg(self, key, value):
+        """Set a config value, marking the config dirty only on change"""
+        if self.config.get(key) != value:
+            self.config[key] = value
+            self._config_dirty = True
+
     def save_config(self):
-        """Save configuration to file"""
+        """Save configuration to file atomically"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            if orjson:
+                payload = orjson.dumps(self.config)
+            else:
+                payload = json.dumps(self.config, separators=(",", ":")).encode()
+            tmp_file = self.config_file.with_suffix(".tmp")
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, self.config_file)
+            self._config_dirty = False
         except Exception as e:
             logging.error(f"Error saving config: {e}")
             
@@ -549,98 +659,87 @@ class UptimeWatcher(QApplication):
         self.tray_icon.show()
         
     def create_timer_icon(self):
-        """Create a simple timer icon"""
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(Qt.transparent)
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Draw clock face
-        painter.setPen(Qt.white if darkdetect.isDark() else Qt.black)
-        painter.drawEllipse(2, 2, 28, 28)
-        
-        # Draw clock hands
-        painter.drawLine(16, 16, 16, 8)   # Hour hand
-        painter.drawLine(16, 16, 22, 16)  # Minute hand
-        
-        painter.end()
-        return QIcon(pixmap)
+        """Return the pre-rendered timer icon for the current theme"""
+        return self._icon_dark if _IS_DARK else self._icon_light
         
     def apply_theme(self):
         """Apply dark theme if system is in dark mode"""
-        if darkdetect.isDark():
-            self.setStyleSheet("""
-                QDialog {
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                }
-                QLabel {
-                    color: #ffffff;
-                }
-                QPushButton {
-                    background-color: #3c3c3c;
-                    border: 1px solid #555555;
-                    color: #ffffff;
-                    padding: 5px;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #4c4c4c;
-                }
-                QSpinBox, QComboBox {
-                    background-color: #3c3c3c;
-                    border: 1px solid #555555;
-                    color: #ffffff;
-                    padding: 2px;
-                }
-            """)
-            
+        global _IS_DARK
+        is_dark = darkdetect.isDark()
+        if is_dark == self._applied_theme:
+            return
+        self._applied_theme = is_dark
+        _IS_DARK = is_dark  # Dialogs built after this pick the new styles
+        self.setStyleSheet(_DARK_QSS if is_dark else "")
+        if hasattr(self, 'tray_icon'):
+            self.tray_icon.setIcon(self.create_timer_icon())
+        # The cached dialogs carry the old theme's stylesheets. A dialog that
+        # is mid-exec() can't be dropped without orphaning it on screen, so
+        # flag the styles stale and rebuild once the current exec() returns
+        if self._reminder_dialog_open():
+            self._dialog_styles_stale = True
+        else:
+            self._reboot_dialog = None
+            self._delay_dialog = None
+
+    def _watch_theme(self):
+        """Block on the OS theme listener and re-apply the theme on change"""
+        try:
+            darkdetect.listener(lambda _theme: self.theme_changed.emit())
+        except NotImplementedError:
+            pass  # No listener support on this platform; theme stays as sampled
+
+
+    def _tick(self):
+        """Compute current uptime and run the reminder checks"""
+        try:
+            uptime_seconds = int(time.time() - self._boot_time)
+            self.handle_uptime(uptime_seconds)
+        except Exception as e:
+            logging.error(f"Error checking uptime: {e}")
+
     def handle_uptime(self, uptime_seconds):
-        """Handle uptime signal from checker thread"""
-        current_boot_time = psutil.boot_time()
-        
-        # Update tray tooltip
-        uptime_str = self.format_uptime(uptime_seconds)
-        self.uptime_action.setText(f"Uptime: {uptime_str}")
-        self.tray_icon.setToolTip(f"UptimeWatcher - Uptime: {uptime_str}")
-        
-        # Check if system has rebooted
-        if self.config["last_boot_time"] != 0 and current_boot_time != self.config["last_boot_time"]:
-            self.config["ignore_today"] = False
-            self.config["ignore_until"] = 0
-            self.config["total_delay_time"] = 0
-            self.config["delay_start_time"] = 0
-            
-        self.config["last_boot_time"] = current_boot_time
-        
+        """Handle a periodic uptime reading"""
+        # Update tray tooltip only when the displayed minute has advanced
+        bucket = uptime_seconds // 60
+        if bucket != self._last_fmt_bucket:
+            uptime_str = self.format_uptime(uptime_seconds)
+            self._last_fmt_bucket = bucket
+            self._last_fmt_str = uptime_str
+            self.uptime_action.setText(f"Uptime: {uptime_str}")
+            self.tray_icon.setToolTip(f"UptimeWatcher - Uptime: {uptime_str}")
+        else:
+            uptime_str = self._last_fmt_str
+
         # Check if we should show reboot reminder
         if uptime_seconds > 24 * 3600:  # More than 24 hours
             current_time = time.time()
             
-            # Check ignore conditions
+            # Check ignore conditions (plain int compare of YYYYMMDD dates,
+            # no datetime construction in the tick path)
             if self.config["ignore_today"]:
-                # Check if it's a new day
-                if datetime.now().date() > datetime.fromtimestamp(self.config["last_reboot_reminder"]).date():
-                    self.config["ignore_today"] = False
-                else:
+                year, month, day = time.localtime(current_time)[:3]
+                today = year * 10000 + month * 100 + day
+                if today < self.config["ignore_until_date"]:
                     return
+                self._set_cfg("ignore_today", False)
                     
             if current_time < self.config["ignore_until"]:
                 return
                 
             # Show reboot reminder
             self.show_reboot_reminder(uptime_seconds)
-            
-        self.save_config()
+
+        if self._config_dirty:
+            self.save_config()
         logging.info(f"Uptime check: {uptime_str}")
         
     def format_uptime(self, seconds):
         """Format uptime seconds to human readable string"""
-        days = seconds // (24 * 3600)
-        hours = (seconds % (24 * 3600)) // 3600
-        minutes = (seconds % 3600) // 60
-        
+        minutes_total, _ = divmod(seconds, 60)
+        hours_total, minutes = divmod(minutes_total, 60)
+        days, hours = divmod(hours_total, 24)
+
         if days > 0:
             return f"{days}d {hours}h {minutes}m"
         elif hours > 0:
@@ -648,65 +747,104 @@ class UptimeWatcher(QApplication):
         else:
             return f"{minutes}m"
             
+    def _reminder_dialog_open(self):
+        """Check whether either reminder dialog is already on screen"""
+        return ((self._reboot_dialog is not None and self._reboot_dialog.isVisible()) or
+                (self._delay_dialog is not None and self._delay_dialog.isVisible()))
+
+    def _flush_stale_dialogs(self):
+        """Drop cached dialogs whose theme went stale while they were open"""
+        if self._dialog_styles_stale and not self._reminder_dialog_open():
+            self._reboot_dialog = None
+            self._delay_dialog = None
+            self._dialog_styles_stale = False
+
     def show_reboot_reminder(self, uptime_seconds):
         """Show reboot reminder dialog"""
+        # A timer tick can land while a dialog's exec() loop is running;
+        # don't reset the live dialog's state or re-enter exec()
+        if self._reminder_dialog_open():
+            return
+        self._flush_stale_dialogs()
+
         uptime_str = self.format_uptime(uptime_seconds)
-        
-        dialog = ModernRebootDialog(None, uptime_str)
+
+        if self._reboot_dialog is None:
+            self._reboot_dialog = ModernRebootDialog(None, uptime_str)
+        else:
+            self._reboot_dialog.set_uptime_text(uptime_str)
+        dialog = self._reboot_dialog
         dialog.exec()
         
         if dialog.user_action == "reboot":
             self.reboot_system()
         elif dialog.user_action == "skip":
             self.handle_delay_request(uptime_seconds)
-        
-        self.save_config()
+
+        if self._config_dirty:
+            self.save_config()
         
     def handle_delay_request(self, uptime_seconds):
         """Handle delay request from user using modern dialog"""
+        if self._delay_dialog is not None and self._delay_dialog.isVisible():
+            return
+        self._flush_stale_dialogs()
+
         # Calculate total delay time so far
         if self.config["delay_start_time"] == 0:
-            self.config["delay_start_time"] = time.time()
-            self.config["total_delay_time"] = 0
-        
+            self._set_cfg("delay_start_time", time.time())
+            self._set_cfg("total_delay_time", 0)
+
         total_delay_hours = self.config["total_delay_time"] // 3600
-        
-        dialog = ModernDelayDialog(None, total_delay_hours)
+
+        if self._delay_dialog is None:
+            self._delay_dialog = ModernDelayDialog(None, total_delay_hours)
+        else:
+            self._delay_dialog.set_total_delay_hours(total_delay_hours)
+        dialog = self._delay_dialog
         if dialog.exec() == QDialog.Accepted:
             delay_seconds = dialog.get_delay_seconds()
-            self.config["ignore_until"] = time.time() + delay_seconds
-            self.config["total_delay_time"] += delay_seconds
+            self._set_cfg("ignore_until", time.time() + delay_seconds)
+            self._set_cfg("total_delay_time", self.config["total_delay_time"] + delay_seconds)
             logging.info(f"Reboot reminder delayed by {delay_seconds} seconds. Total delay: {self.config['total_delay_time']} seconds")
             
     def reboot_system(self):
         """Reboot the system based on platform"""
+        if sys.platform.startswith('win'):
+            cmd = ['shutdown', '/r', '/t', '0']
+        elif sys.platform.startswith('darwin'):  # macOS
+            cmd = ['sudo', 'shutdown', '-r', 'now']
+        elif sys.platform.startswith('linux') and os.path.exists('/run/systemd/system'):
+            cmd = ['systemctl', 'reboot']
+        elif sys.platform.startswith('linux') or sys.platform.startswith('freebsd'):
+            cmd = ['sudo', 'reboot']
+        else:
+            QMessageBox.warning(None, "Unsupported Platform",
+                              "Automatic reboot is not supported on this platform.")
+            logging.warning("Unsupported platform for automatic reboot")
+            return
+
+        # Spawn on the next event-loop turn so the dialog teardown paints
+        # before the reboot command runs
+        QTimer.singleShot(0, functools.partial(self._spawn_reboot, cmd))
+
+    def _spawn_reboot(self, cmd):
+        """Launch the reboot command without blocking the GUI thread"""
         try:
-            if sys.platform.startswith('win'):
-                os.system('shutdown /r /t 0')
-            elif sys.platform.startswith('darwin'):  # macOS
-                os.system('sudo shutdown -r now')
-            elif sys.platform.startswith('linux') or sys.platform.startswith('freebsd'):
-                os.system('sudo reboot')
-            else:
-                QMessageBox.warning(None, "Unsupported Platform", 
-                                  "Automatic reboot is not supported on this platform.")
-                logging.warning("Unsupported platform for automatic reboot")
-        except Exception as e:
+            # List argv + no shell: skips the /bin/sh fork and quoting issues;
+            # Popen returns immediately instead of waiting on the command
+            subprocess.Popen(cmd, close_fds=True)
+        except FileNotFoundError as e:
             logging.error(f"Error rebooting system: {e}")
             QMessageBox.critical(None, "Reboot Error", f"Failed to reboot: {e}")
             
     def show_settings(self):
         """Show settings dialog"""
-        if os.name == 'nt':
-            log_file = Path(os.getenv('APPDATA')) / "UptimeWatcher" / "uptimewatcher.log"
-        else:
-            log_file = Path("/tmp/SelfCare/uptimewatcher.log")
-        
         msg = QMessageBox()
         msg.setIcon(QMessageBox.Information)
         msg.setWindowTitle("Settings")
         msg.setText("UptimeWatcher Settings")
-        msg.setInformativeText(f"Config file: {self.config_file}\nLog file: {log_file}")
+        msg.setInformativeText(f"Config file: {CONFIG_FILE}\nLog file: {LOG_FILE}")
         msg.exec()
         
     def show_about(self):
@@ -718,16 +856,20 @@ class UptimeWatcher(QApplication):
         msg.setInformativeText("A cross-platform system uptime monitor\n\nMonitors system uptime and reminds you to reboot after 24 hours.")
         msg.exec()
         
+    def _refresh_boot_time(self):
+        """Re-read boot time from the OS; only the manual test path needs this"""
+        self._boot_time = psutil.boot_time()
+
     def test_dialog(self):
         """Test the modern dialog (for demo purposes)"""
-        # Test the reboot dialog
-        uptime_seconds = int(time.time() - psutil.boot_time())
+        # Test the reboot dialog with a freshly sampled boot time
+        self._refresh_boot_time()
+        uptime_seconds = int(time.time() - self._boot_time)
         self.show_reboot_reminder(uptime_seconds)
         
     def quit_application(self):
         """Quit the application"""
-        self.uptime_checker.stop()
-        self.uptime_checker.wait()
+        self.uptime_timer.stop()
         logging.info("UptimeWatcher stopped")
         self.quit()
 